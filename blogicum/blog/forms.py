@@ -9,12 +9,21 @@ class CommentForm(forms.ModelForm):
     class Meta:
         model = Comment
         fields = ['text']
+        widgets = {'text': forms.Textarea()}
 
 
 class PostForm(forms.ModelForm):
     class Meta:
         model = Post
-        exclude = ['author']
+        fields = [
+            'title', 'text', 'pub_date', 'location', 'category',
+            'image', 'is_published',
+        ]
+        widgets = {
+            'pub_date': forms.DateTimeInput(
+                attrs={'type': 'datetime-local'}, format='%Y-%m-%dT%H:%M'
+            ),
+        }
 
 
 class CustomUserCreationForm(UserCreationForm):
@@ -27,19 +36,3 @@ class ProfileForm(forms.ModelForm):
     class Meta:
         model = User
         exclude = ()
-
-
-class PasswordChangeForm(forms.Form):
-    password1 = forms.CharField(
-        label='New password', widget=forms.PasswordInput
-    )
-    password2 = forms.CharField(
-        label='Confirm new password', widget=forms.PasswordInput
-    )
-
-    def clean(self):
-        cleaned_data = super().clean()
-        password1 = cleaned_data.get('password1')
-        password2 = cleaned_data.get('password2')
-        if password1 and password2 and password1 != password2:
-            raise forms.ValidationError("Passwords don't match")
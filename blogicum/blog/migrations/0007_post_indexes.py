@@ -0,0 +1,25 @@
+# Generated by Django 3.2.16 on 2026-08-31 08:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_alter_post_category'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-pub_date', 'is_published'], name='blog_post_pub_dat_62a095_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author', '-pub_date'], name='blog_post_author__1a4cc4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', '-pub_date'], name='blog_post_categor_556717_idx'),
+        ),
+    ]
@@ -1,9 +1,42 @@
 from django.db import models
+from django.db.models import Count
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.utils import timezone
 
 User = get_user_model()
 
+
+class PublishedPostQuerySet(models.QuerySet):
+    def published(self, now=None):
+        return self.filter(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=now or timezone.now(),
+        )
+
+    def with_related(self):
+        return self.select_related(
+            'category', 'author', 'location'
+        ).only(
+            'id', 'title', 'text', 'pub_date', 'image', 'is_published',
+            'author__username',
+            'category__slug', 'category__title', 'category__is_published',
+            'location__name', 'location__is_published',
+        ).prefetch_related(
+            models.Prefetch(
+                'comments',
+                queryset=Comment.objects.select_related('author').only(
+                    'id', 'text', 'created_at', 'post_id', 'author__username',
+                ),
+            )
+        ).annotate(comment_count=Count('comments')).order_by('-pub_date')
+
+    def stream(self, chunk=2000):
+        """Пройти по выборке чанками, не загружая всю таблицу в память."""
+        return self.iterator(chunk_size=chunk)
+
+
 class Category(models.Model):
     title = models.CharField('Заголовок', max_length=256)
     description = models.TextField('Описание')
@@ -90,9 +123,17 @@ class Post(models.Model):
         null=True
     )
 
+    objects = PublishedPostQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
+        ordering = ['-pub_date']
+        indexes = [
+            models.Index(fields=['-pub_date', 'is_published']),
+            models.Index(fields=['author', '-pub_date']),
+            models.Index(fields=['category', '-pub_date']),
+        ]
 
     def __str__(self):
         return self.title
@@ -100,10 +141,6 @@ class Post(models.Model):
     def get_absolute_url(self):
         return reverse('blog:post_detail', kwargs={'post_id': self.pk})
 
-    @property
-    def comment_count(self):
-        return self.comments.count()
-
 
 class Comment(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='comments')
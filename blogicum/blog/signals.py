@@ -0,0 +1,14 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Comment, Post
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_index_cache(sender, **kwargs):
+    """Сбросить кеш главной страницы при изменении постов или комментариев."""
+    cache.clear()
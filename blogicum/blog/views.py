@@ -1,37 +1,78 @@
-from django.utils import timezone
 from django.views.generic import CreateView, UpdateView, DetailView
 from django.urls import reverse_lazy, reverse
 from django.core.paginator import Paginator
+from django.views.decorators.cache import cache_page
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth import update_session_auth_hash, get_user_model
-from django.http import Http404, HttpResponseForbidden
+from django.contrib.auth.forms import SetPasswordForm
+from django.db.models import Q
+from django.http import HttpResponseBadRequest
+from django.utils import timezone
+from django.views.decorators.http import require_POST
 
-from .forms import PostForm, CommentForm, ProfileForm, PasswordChangeForm
+from .forms import PostForm, CommentForm, ProfileForm
 from .models import Post, Category, Comment
 
 User = get_user_model()
 LIMIT_POSTS = 10
 
 
-def profile_view(request, username):
-    user = get_object_or_404(User, username=username)
-    posts = user.posts.all()
+class WindowedPage:
+    """Paginator-like page built from a LIMIT/OFFSET window, without COUNT(*)."""
+
+    def __init__(self, object_list, number, has_next):
+        self.object_list = object_list
+        self.number = number
+        self.has_next = has_next
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_previous(self):
+        return self.number > 1
+
+    @property
+    def has_other_pages(self):
+        return self.has_previous or self.has_next
+
+    def previous_page_number(self):
+        return self.number - 1
+
+    def next_page_number(self):
+        return self.number + 1
 
-    current_time = timezone.now()
+
+def windowed_page(queryset, page, size=LIMIT_POSTS):
+    """Fetch one page plus a lookahead row instead of issuing COUNT(*)."""
+    try:
+        number = max(int(page or 1), 1)
+    except (TypeError, ValueError):
+        number = 1
+    offset = (number - 1) * size
+    window = list(queryset[offset:offset + size + 1])
+    return WindowedPage(window[:size], number, len(window) > size)
+
+
+def profile_view(request, username):
+    user = get_object_or_404(
+        User.objects.only(
+            'id', 'username', 'first_name', 'last_name',
+            'date_joined', 'is_staff',
+        ),
+        username=username,
+    )
+    posts = user.posts.with_related()
 
     if request.user.username != username:
-        posts = posts.filter(
-            is_published=True,
-            category__is_published=True,
-            pub_date__lte=current_time,
-        )
+        posts = posts.published()
 
-    posts = posts.order_by('-pub_date')
-    paginator = Paginator(posts, LIMIT_POSTS)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = windowed_page(posts, request.GET.get('page'))
 
     context = {
         'profile': user,
@@ -55,16 +96,12 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
 @login_required
 def password_change_view(request, username):
     user = request.user
-    if request.method == 'POST':
-        form = PasswordChangeForm(request.POST)
-        if form.is_valid():
-            password = form.cleaned_data['password1']
-            user.set_password(password)
-            user.save()
-            update_session_auth_hash(request, user)
-            return redirect('blog:password_change_done')
-    else:
-        form = PasswordChangeForm()
+    form = SetPasswordForm(user, request.POST or None)
+    if request.method == 'POST' and form.is_valid():
+        form.save(commit=False)
+        user.save(update_fields=['password'])
+        update_session_auth_hash(request, user)
+        return redirect('blog:password_change_done')
 
     context = {'form': form}
     return render(request, 'blog/password_change_form.html', context)
@@ -78,18 +115,31 @@ class PostMixin:
 
 class PostCreateView(LoginRequiredMixin, PostMixin, CreateView):
     pk_url_kwarg = 'post_id'
+    _profile_url_template = None
 
     def form_valid(self, form):
         form.instance.author = self.request.user
         return super().form_valid(form)
 
     def get_success_url(self):
-        return reverse('blog:profile', kwargs={'username': self.request.user.username})
+        cls = type(self)
+        if cls._profile_url_template is None:
+            cls._profile_url_template = reverse(
+                'blog:profile', kwargs={'username': '__username__'}
+            )
+        return cls._profile_url_template.replace(
+            '__username__', self.request.user.username
+        )
 
 
 class PostUpdateView(LoginRequiredMixin, PostMixin, UpdateView):
     pk_url_kwarg = 'post_id'
 
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_cached_object'):
+            self._cached_object = super().get_object(queryset)
+        return self._cached_object
+
     def dispatch(self, request, *args, **kwargs):
         if self.get_object().author != request.user:
             return redirect('blog:post_detail', self.kwargs['post_id'])
@@ -123,79 +173,81 @@ class PostDetailView(DetailView):
     context_object_name = 'post'
     pk_url_kwarg = 'post_id'
 
-    def get_object(self):
-        obj = super().get_object()
-        if self.request.user != obj.author and (
-            not obj.is_published or not obj.category.is_published
-        ):
-            raise Http404()
-        return obj
+    def get_queryset(self):
+        queryset = Post.objects.select_related('category', 'author', 'location')
+        public = Q(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=timezone.now(),
+        )
+        if self.request.user.is_authenticated:
+            return queryset.filter(Q(author=self.request.user) | public)
+        return queryset.filter(public)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = self.object.comments.select_related('author')
+        paginator = Paginator(
+            self.object.comments.select_related('author').order_by('created_at'),
+            LIMIT_POSTS,
+        )
+        page_number = self.request.GET.get('page')
+        context['comments'] = paginator.get_page(page_number)
         return context
 
 
-def index(request):
+def _render_index(request):
     template = 'blog/index.html'
-    current_time = timezone.now()
-    posts = Post.objects.select_related('category').filter(
-        pub_date__lte=current_time,
-        is_published=True,
-        category__is_published=True,
-    ).order_by('-pub_date')
-    paginator = Paginator(posts, LIMIT_POSTS)
-
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    posts = Post.objects.with_related().published()
+    page_obj = windowed_page(posts, request.GET.get('page'))
     context = {'page_obj': page_obj}
     return render(request, template, context)
 
 
+_cached_index = cache_page(60)(_render_index)
+
+
+def index(request):
+    if request.user.is_anonymous:
+        return _cached_index(request)
+    return _render_index(request)
+
+
 def category_posts(request, category_slug):
     template = 'blog/category.html'
-    current_time = timezone.now()
     category = get_object_or_404(Category, slug=category_slug, is_published=True)
-    post_list = category.posts.select_related('category').filter(
-        is_published=True,
-        pub_date__lte=current_time,
-    ).order_by('-pub_date')
-    paginator = Paginator(post_list, LIMIT_POSTS)
-
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    post_list = category.posts.with_related().published()
+    page_obj = windowed_page(post_list, request.GET.get('page'))
 
     context = {'category': category, 'page_obj': page_obj}
     return render(request, template, context)
 
 
 @login_required
+@require_POST
 def add_comment(request, post_id):
     post = get_object_or_404(Post, pk=post_id)
-    form = CommentForm(request.POST or None)
+    form = CommentForm(request.POST)
 
     if form.is_valid():
-        comment = form.save(commit=False)
-        comment.author = request.user
-        comment.post = post
-        comment.save()
+        Comment.objects.create(
+            text=form.cleaned_data['text'],
+            author=request.user,
+            post=post,
+        )
         return redirect('blog:post_detail', post_id)
 
-    context = {
-        'post': post,
-        'form': form,
-        'comments': post.comments.select_related('author'),
-    }
-    return render(request, 'blog/detail.html', context)
+    return HttpResponseBadRequest('Некорректные данные комментария.')
 
 
 @login_required
 def edit_comment(request, post_id, comment_id):
-    comment = get_object_or_404(Comment, id=comment_id)
-    if comment.author != request.user:
-        return HttpResponseForbidden('У вас нет прав для редактирования этого комментария.')
+    comment = get_object_or_404(
+        Comment.objects.select_related('author'),
+        id=comment_id,
+        author=request.user,
+        post_id=post_id,
+    )
 
     if request.method == 'POST':
         form = CommentForm(request.POST, instance=comment)
@@ -215,9 +267,12 @@ def edit_comment(request, post_id, comment_id):
 
 @login_required
 def delete_comment(request, post_id, comment_id):
-    comment = get_object_or_404(Comment, id=comment_id)
-    if comment.author != request.user:
-        return HttpResponseForbidden("У вас нет прав для удаления этого комментария.")
+    comment = get_object_or_404(
+        Comment.objects.select_related('author'),
+        id=comment_id,
+        author=request.user,
+        post_id=post_id,
+    )
 
     if request.method == "POST":
         comment.delete()
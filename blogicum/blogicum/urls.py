@@ -21,7 +21,13 @@ urlpatterns = [
           ),
       name='registration',
     ),
-] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+]
+
+# В продакшене статику раздаёт WhiteNoise, а не Django.
+if settings.DEBUG:
+    urlpatterns += static(
+        settings.STATIC_URL, document_root=settings.STATIC_ROOT
+    )
 
 
 